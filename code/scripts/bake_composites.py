@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Bake Sentinel-2 composites into Earth Engine assets
+
+Exports the before/after median composites for every date range listed in
+PRECOMPUTED_COMPOSITES, so the dashboard can load them directly instead of
+recomputing the median each session. Once the export tasks have finished,
+set USE_PRECOMPUTED_COMPOSITES=true for the dashboard.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add the code/src directory to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import ee
+
+from auth.gee_auth import initialize_ee
+from utils.constants import PRECOMPUTED_COMPOSITES
+from data.loaders.gee_loaders import create_fire_aoi, build_sentinel_composites
+
+# Bands used by the dashboard's visualizations and indices
+EXPORT_BANDS = ['B2', 'B3', 'B4', 'B8', 'B11', 'B12']
+
+
+def export_composite(image, asset_id, aoi):
+    """Start an export task writing a composite to an Earth Engine asset."""
+    task = ee.batch.Export.image.toAsset(
+        image=image.select(EXPORT_BANDS),
+        description=asset_id.rsplit('/', 1)[-1],
+        assetId=asset_id,
+        region=aoi,
+        scale=10,
+        maxPixels=1e9,
+        pyramidingPolicy={'.default': 'mean'}
+    )
+    task.start()
+    return task
+
+
+def main():
+    """Export all configured composites."""
+    if not initialize_ee(project_id=os.getenv('GEE_PROJECT_ID')):
+        print("❌ Google Earth Engine initialization failed")
+        sys.exit(1)
+    
+    aoi = create_fire_aoi()
+    
+    for (before_date, after_date), assets in PRECOMPUTED_COMPOSITES.items():
+        imagery = build_sentinel_composites(before_date, after_date, aoi, use_precomputed=False)
+        for label, image in (('before', imagery['sentinel_before']), ('after', imagery['sentinel_after'])):
+            task = export_composite(image, assets[label], aoi)
+            print(f"🚀 Started export {task.id}: {assets[label]}")
+    
+    print("\n✅ Export tasks submitted - monitor progress with: earthengine task list")
+
+
+if __name__ == "__main__":
+    main()
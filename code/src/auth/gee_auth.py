@@ -5,21 +5,36 @@ Handles authentication and initialization for Google Earth Engine.
 """
 
 import os
+import functools
 import ee
 import pyproj
 from pathlib import Path
 from typing import Optional, Dict, Any
 import logging
 
+from utils.cache import disk_cache
+from utils.constants import EE_CONNECTION_CACHE_TTL
+
 logger = logging.getLogger(__name__)
 
+# Set once PROJ data has been configured so repeated initializations skip it
+_PROJ_DATA_INITIALIZED = False
+
+# Set once Earth Engine has been initialized so repeated calls are no-ops
+_EE_INITIALIZED = False
+
 
 def set_proj_data():
     """
     Set PROJ_DATA environment variable to avoid projection errors.
     
     This addresses common PROJ data directory issues in GEE Python environments.
+    Only runs once per process.
     """
+    global _PROJ_DATA_INITIALIZED
+    if _PROJ_DATA_INITIALIZED:
+        return
+    
     try:
         # Try to set PROJ_DATA automatically
         pyproj.datadir.set_data_dir()
@@ -32,10 +47,21 @@ def set_proj_data():
                 os.environ['PROJ_DATA'] = proj_data_path
                 os.environ['PROJ_LIB'] = proj_data_path
                 logger.info(f"Set PROJ_DATA to: {proj_data_path}")
+        
+        _PROJ_DATA_INITIALIZED = True
     except Exception as e:
         logger.warning(f"Could not set PROJ_DATA automatically: {e}")
 
 
+@functools.lru_cache(maxsize=1)
+def _build_service_credentials(credentials_path: str, email: Optional[str] = None):
+    """Parse the service account key file once and reuse the credentials."""
+    return ee.ServiceAccountCredentials(
+        email=email,  # Read from credentials file when None
+        key_file=credentials_path
+    )
+
+
 def initialize_ee(
     project_id: Optional[str] = None,
     use_service_account: bool = False,
@@ -45,6 +71,10 @@ def initialize_ee(
     """
     Initialize Earth Engine with proper authentication.
     
+    Subsequent calls after a successful initialization return immediately.
+    A service account is used when requested, or automatically when the
+    GEE_SERVICE_ACCOUNT and GEE_SERVICE_ACCOUNT_KEY environment variables are set.
+    
     Args:
         project_id: Google Cloud Project ID for Earth Engine
         use_service_account: Whether to use service account authentication
@@ -58,6 +88,10 @@ def initialize_ee(
         ValueError: If required parameters are missing
         ee.EEException: If Earth Engine initialization fails
     """
+    global _EE_INITIALIZED
+    if _EE_INITIALIZED:
+        return True
+    
     try:
         # Set PROJ data to avoid projection errors
         set_proj_data()
@@ -68,6 +102,13 @@ def initialize_ee(
             if not project_id:
                 raise ValueError("Project ID must be provided or set in GEE_PROJECT_ID environment variable")
         
+        # Service account from environment (production/Cloud, non-interactive)
+        service_account = os.getenv('GEE_SERVICE_ACCOUNT')
+        service_account_key = os.getenv('GEE_SERVICE_ACCOUNT_KEY')
+        if service_account and service_account_key:
+            use_service_account = True
+            credentials_path = credentials_path or service_account_key
+        
         if use_service_account:
             # Production: service account authentication
             if not credentials_path:
@@ -76,13 +117,10 @@ def initialize_ee(
             if not credentials_path or not os.path.exists(credentials_path):
                 raise ValueError(
                     "Service account credentials file not found. "
-                    "Set GOOGLE_APPLICATION_CREDENTIALS environment variable or provide credentials_path."
+                    "Set GEE_SERVICE_ACCOUNT_KEY or GOOGLE_APPLICATION_CREDENTIALS, or provide credentials_path."
                 )
             
-            credentials = ee.ServiceAccountCredentials(
-                email=None,  # Will be read from credentials file
-                key_file=credentials_path
-            )
+            credentials = _build_service_credentials(credentials_path, service_account)
             
             # Set high-volume endpoint if requested
             if use_high_volume:
@@ -111,6 +149,7 @@ def initialize_ee(
         
         # Test the connection
         test_connection()
+        _EE_INITIALIZED = True
         return True
         
     except Exception as e:
@@ -122,13 +161,21 @@ def test_connection() -> bool:
     """
     Test the Earth Engine connection by making a simple request.
     
+    A successful result is cached on disk for EE_CONNECTION_CACHE_TTL seconds,
+    so restarts within that window skip the round-trip.
+    
     Returns:
         bool: True if connection successful, False otherwise
     """
+    if disk_cache.get('ee_connection_ok'):
+        logger.info("Earth Engine connection verified recently, skipping test")
+        return True
+    
     try:
         # Simple test to verify connection
         image = ee.Image(1)
         info = image.getInfo()
+        disk_cache.set('ee_connection_ok', True, expire=EE_CONNECTION_CACHE_TTL)
         logger.info("Earth Engine connection test successful")
         return True
     except Exception as e:
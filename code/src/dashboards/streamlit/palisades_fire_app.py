@@ -5,24 +5,39 @@ Interactive dashboard for analyzing the January 2025 Palisades Fire in Los Angel
 using Google Earth Engine data to show before/after conditions and fire impact.
 """
 
+import os
+import json
 import streamlit as st
-import geemap
 import ee
-import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 import sys
 from pathlib import Path
 
-# Add src to path for imports
-src_path = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(src_path))
+# geemap >= 0.37 breaks `import geemap.foliumap` unless USE_FOLIUM is set before import
+os.environ.setdefault("USE_FOLIUM", "1")
+
+# Add src to path for imports (once - Streamlit re-executes this script on every rerun)
+_SRC_PATH = str(Path(__file__).resolve().parent.parent.parent)
+if _SRC_PATH not in sys.path:
+    sys.path.insert(0, _SRC_PATH)
 
 from auth.gee_auth import initialize_ee
 from utils.constants import (
     PALISADES_FIRE_CENTER, 
-    PALISADES_FIRE_BBOX, 
+    PALISADES_FIRE_FOLIUM_BOUNDS,
     PALISADES_FIRE_START_DATE,
-    FIRE_VIS_PARAMS
+    FIRE_VIS_PARAMS,
+    BURN_SEVERITY_THRESHOLDS,
+    CACHE_TIMEOUT,
+    LOGO_PATH,
+    BANNER_PATH
+)
+from data.loaders.gee_loaders import (
+    SENTINEL2_COLLECTION,
+    get_band_names,
+    zero_image,
+    create_fire_aoi,
+    build_sentinel_composites
 )
 
 # Handle GEE Project ID from secrets or environment
@@ -64,47 +79,22 @@ def init_earth_engine():
         st.info("📝 You can still explore the dashboard interface and methodology")
         return False
 
-@st.cache_resource
-def create_fire_aoi():
-    """Create Area of Interest for Palisades Fire."""
-    try:
-        return ee.Geometry.Rectangle(PALISADES_FIRE_BBOX)
-    except:
-        # Return None if Earth Engine is not available
-        return None
-
+@st.cache_data(ttl=CACHE_TIMEOUT, hash_funcs={ee.Geometry: lambda g: g.serialize()})
 def load_fire_datasets(before_date, after_date, aoi):
     """Load Sentinel-2 satellite imagery before and after the fire."""
-    
-    # Sentinel-2 collection  
-    sentinel2 = ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED')
-    
-    # Before fire imagery (6 months lookback window)
-    before_start = (datetime.strptime(before_date, '%Y-%m-%d') - timedelta(days=180)).strftime('%Y-%m-%d')
-    
-    sentinel_before = (sentinel2
-                      .filterDate(before_start, before_date)
-                      .filterBounds(aoi)
-                      .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20))
-                      .median()
-                      .clip(aoi))
-    
-    # After fire imagery (30 day window) 
-    after_end = (datetime.strptime(after_date, '%Y-%m-%d') + timedelta(days=30)).strftime('%Y-%m-%d')
-    
-    sentinel_after = (sentinel2
-                     .filterDate(after_date, after_end)
-                     .filterBounds(aoi)
-                     .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 30))
-                     .median()
-                     .clip(aoi))
-    
-    return {
-        'sentinel_before': sentinel_before,
-        'sentinel_after': sentinel_after
-    }
+    return build_sentinel_composites(before_date, after_date, aoi)
+
+def _empty_indices():
+    """Placeholder indices returned when the imagery can't be analyzed."""
+    zero = zero_image()
+    return {name: zero for name in (
+        'nbr_before', 'nbr_after', 'dnbr',
+        'ndvi_before', 'ndvi_after',
+        'ndwi_before', 'ndwi_after'
+    )}
 
-def calculate_fire_indices(before_img, after_img):
+@st.cache_resource(ttl=CACHE_TIMEOUT, hash_funcs={ee.Image: lambda img: img.serialize()})
+def calculate_fire_indices(before_img, after_img, collection_id=SENTINEL2_COLLECTION):
     """Calculate fire-related spectral indices using Sentinel-2 bands."""
     
     # Sentinel-2 band names
@@ -114,73 +104,67 @@ def calculate_fire_indices(before_img, after_img):
     green_band = 'B3'   # Green
     
     try:
-        # Verify bands are available
-        band_names = before_img.bandNames().getInfo()
-        required_bands = [nir_band, red_band, swir_band, green_band]
+        # Verify bands are available (cached per collection)
+        band_names = get_band_names(collection_id)
+        required_bands = {nir_band, red_band, swir_band, green_band}
         
-        if not all(band in band_names for band in required_bands):
+        if not band_names.issuperset(required_bands):
             # Return empty indices if required bands are missing
-            return {
-                'nbr_before': ee.Image(0),
-                'nbr_after': ee.Image(0),
-                'dnbr': ee.Image(0),
-                'ndvi_before': ee.Image(0),
-                'ndvi_after': ee.Image(0),
-                'ndwi_before': ee.Image(0),
-                'ndwi_after': ee.Image(0)
-            }
+            return _empty_indices()
     except Exception:
         # Return empty indices if there's any error
-        return {
-            'nbr_before': ee.Image(0),
-            'nbr_after': ee.Image(0),
-            'dnbr': ee.Image(0),
-            'ndvi_before': ee.Image(0),
-            'ndvi_after': ee.Image(0),
-            'ndwi_before': ee.Image(0),
-            'ndwi_after': ee.Image(0)
-        }
-    
-    # Calculate NBR (Normalized Burn Ratio)
-    nbr_before = before_img.normalizedDifference([nir_band, swir_band]).rename('NBR_before')
-    nbr_after = after_img.normalizedDifference([nir_band, swir_band]).rename('NBR_after')
+        return _empty_indices()
+    
+    # Stack before/after bands into one image so all indices share band reads.
+    # Cast to float so indices stay float (as normalizedDifference was) whatever
+    # the source pixel type.
+    bands = [nir_band, red_band, swir_band, green_band]
+    combined = ee.Image.cat([
+        before_img.select(bands).rename(['nirB', 'redB', 'swirB', 'greenB']),
+        after_img.select(bands).rename(['nirA', 'redA', 'swirA', 'greenA'])
+    ]).toFloat()
+    
+    # Normalized differences (a - b) / (a + b), computed band-wise in one expression:
+    # NBR (Normalized Burn Ratio), NDVI (vegetation health), NDWI (water/moisture content)
+    normalized = combined.expression('(a - b) / (a + b)', {
+        # Bands repeat across indices, so rename on select to keep names unique
+        'a': combined.select(['nirB', 'nirA', 'nirB', 'nirA', 'greenB', 'greenA'],
+                             ['a0', 'a1', 'a2', 'a3', 'a4', 'a5']),
+        'b': combined.select(['swirB', 'swirA', 'redB', 'redA', 'nirB', 'nirA'],
+                             ['b0', 'b1', 'b2', 'b3', 'b4', 'b5'])
+    }).rename(['NBR_before', 'NBR_after', 'NDVI_before', 'NDVI_after', 'NDWI_before', 'NDWI_after'])
     
     # Calculate dNBR (difference NBR) - key fire damage indicator
-    dnbr = nbr_before.subtract(nbr_after).rename('dNBR')
-    
-    # Calculate NDVI (vegetation health)
-    ndvi_before = before_img.normalizedDifference([nir_band, red_band]).rename('NDVI_before')
-    ndvi_after = after_img.normalizedDifference([nir_band, red_band]).rename('NDVI_after')
-    
-    # Calculate NDWI (water/moisture content)
-    ndwi_before = before_img.normalizedDifference([green_band, nir_band]).rename('NDWI_before')
-    ndwi_after = after_img.normalizedDifference([green_band, nir_band]).rename('NDWI_after')
+    dnbr = normalized.select('NBR_before').subtract(normalized.select('NBR_after')).rename('dNBR')
     
     return {
-        'nbr_before': nbr_before,
-        'nbr_after': nbr_after,
+        'nbr_before': normalized.select('NBR_before'),
+        'nbr_after': normalized.select('NBR_after'),
         'dnbr': dnbr,
-        'ndvi_before': ndvi_before,
-        'ndvi_after': ndvi_after,
-        'ndwi_before': ndwi_before,
-        'ndwi_after': ndwi_after
+        'ndvi_before': normalized.select('NDVI_before'),
+        'ndvi_after': normalized.select('NDVI_after'),
+        'ndwi_before': normalized.select('NDWI_before'),
+        'ndwi_after': normalized.select('NDWI_after')
     }
 
+# e.g. "(b(0) >= -0.1) + (b(0) >= 0.1) + ..." - one comparison per class threshold
+_BURN_SEVERITY_EXPRESSION = ' + '.join(f'(b(0) >= {t})' for t in BURN_SEVERITY_THRESHOLDS)
+
 def classify_burn_severity(dnbr):
     """Classify burn severity based on dNBR values."""
     
-    # Standard burn severity classification
-    severity = (dnbr.where(dnbr.lt(-0.1), 0)  # Unburned/Low
-                    .where(dnbr.gte(-0.1).And(dnbr.lt(0.1)), 1)  # Unburned/Low
-                    .where(dnbr.gte(0.1).And(dnbr.lt(0.27)), 2)  # Low severity
-                    .where(dnbr.gte(0.27).And(dnbr.lt(0.44)), 3)  # Moderate-low severity
-                    .where(dnbr.gte(0.44).And(dnbr.lt(0.66)), 4)  # Moderate-high severity
-                    .where(dnbr.gte(0.66), 5))  # High severity
+    # Standard burn severity classification: class index (0-5) is the number of
+    # thresholds the pixel meets, evaluated as one pixel-wise expression
+    # 0: Unburned/Low (< -0.1), 1: Unburned/Low, 2: Low, 3: Moderate-low,
+    # 4: Moderate-high, 5: High severity (>= 0.66)
+    severity = dnbr.expression(_BURN_SEVERITY_EXPRESSION)
     
     return severity.rename('burn_severity')
 
 def create_base_map():
     """Create a standardized base map with consistent settings."""
+    import geemap.foliumap as geemap
+    
     return geemap.Map(
         center=PALISADES_FIRE_CENTER, 
         zoom=11, 
@@ -190,6 +174,31 @@ def create_base_map():
         search_control=False
     )
 
+@st.cache_data(ttl=CACHE_TIMEOUT)
+def _cached_tile_url(image_json, vis_json):
+    """Request a map ID for a serialized image and visualization (cache miss path)."""
+    image = ee.Image(ee.deserializer.fromJSON(image_json))
+    return image.visualize(**json.loads(vis_json)).getMapId()['tile_fetcher'].url_format
+
+def get_tile_url(image, vis_params):
+    """Get the Earth Engine tile URL for an image, requesting a map ID once per unique image."""
+    # Key on the serialized graph and key-sorted vis params so equal inputs always hit
+    return _cached_tile_url(image.serialize(), json.dumps(dict(vis_params), sort_keys=True))
+
+def create_tile_layer(image, vis_params, name, shown=True):
+    """Create a folium tile layer for an Earth Engine image using a cached tile URL."""
+    import folium
+    
+    return folium.TileLayer(
+        tiles=get_tile_url(image, vis_params),
+        attr='Google Earth Engine',
+        name=name,
+        overlay=True,
+        control=True,
+        show=shown,
+        max_zoom=24
+    )
+
 def create_comparison_map(imagery, indices, aoi):
     """Create interactive comparison map."""
     
@@ -207,21 +216,20 @@ def create_comparison_map(imagery, indices, aoi):
     
     # Add fire damage analysis only (main map)
     if 'dnbr' in indices:
-        m.addLayer(indices['dnbr'], dnbr_vis, 'Fire Damage (dNBR)', True)
+        create_tile_layer(indices['dnbr'], dnbr_vis, 'Fire Damage (dNBR)', True).add_to(m)
     
     return m
 
 def create_sentinel_swipe_map(imagery, aoi):
     """Create split-panel swipe map for Sentinel-2 before and after comparison."""
-    
     # Use standardized Sentinel-2 visualization
     sentinel_rgb_vis = FIRE_VIS_PARAMS['sentinel_rgb']
     
     # Create split-panel map if both images exist
     if imagery['sentinel_before'] and imagery['sentinel_after']:
-        # Create tile layers using geemap.ee_tile_layer
-        left_layer = geemap.ee_tile_layer(imagery['sentinel_before'], sentinel_rgb_vis, 'Before Fire')
-        right_layer = geemap.ee_tile_layer(imagery['sentinel_after'], sentinel_rgb_vis, 'After Fire')
+        # Create tile layers sharing cached EE tile URLs
+        left_layer = create_tile_layer(imagery['sentinel_before'], sentinel_rgb_vis, 'Before Fire')
+        right_layer = create_tile_layer(imagery['sentinel_after'], sentinel_rgb_vis, 'After Fire')
         
         # Create map with split panel
         m = create_base_map()
@@ -233,15 +241,14 @@ def create_sentinel_swipe_map(imagery, aoi):
 
 def create_nbr_swipe_map(indices, aoi):
     """Create split-panel swipe map for NBR before and after comparison."""
-    
     # Use standardized NBR visualization
     nbr_vis = FIRE_VIS_PARAMS['nbr']
     
     # Create split-panel map if both NBR images exist
     if 'nbr_before' in indices and 'nbr_after' in indices:
-        # Create tile layers using geemap.ee_tile_layer
-        left_layer = geemap.ee_tile_layer(indices['nbr_before'], nbr_vis, 'NBR Before')
-        right_layer = geemap.ee_tile_layer(indices['nbr_after'], nbr_vis, 'NBR After')
+        # Create tile layers sharing cached EE tile URLs
+        left_layer = create_tile_layer(indices['nbr_before'], nbr_vis, 'NBR Before')
+        right_layer = create_tile_layer(indices['nbr_after'], nbr_vis, 'NBR After')
         
         # Create map with split panel
         m = create_base_map()
@@ -263,53 +270,40 @@ def create_burn_severity_map(indices, aoi):
     
     # Add burn severity if available
     if 'burn_severity' in indices:
-        m.addLayer(indices['burn_severity'], severity_vis, 'Burn Severity Classification', True)
+        create_tile_layer(indices['burn_severity'], severity_vis, 'Burn Severity Classification', True).add_to(m)
     
     return m
 
 def calculate_fire_statistics(indices, aoi):
-    """Calculate fire impact statistics."""
+    """Calculate fire impact statistics (area in hectares) in a single EE request."""
     
     try:
-        if 'dnbr' in indices:
-            # Calculate area statistics
-            dnbr = indices['dnbr']
+        if 'dnbr' in indices and 'burn_severity' in indices:
+            severity = indices['burn_severity']
             
             # Total area calculation
             area_image = ee.Image.pixelArea().divide(10000)  # Convert to hectares
             
-            # Burned area (dNBR > 0.1)
-            burned_mask = dnbr.gte(0.1)
-            burned_area = area_image.updateMask(burned_mask)
-            
-            # Calculate total burned area
-            burned_stats = burned_area.reduceRegion(
-                reducer=ee.Reducer.sum(),
+            # Area by severity class, grouped server-side in one reduction
+            grouped = area_image.addBands(severity).reduceRegion(
+                reducer=ee.Reducer.sum().group(groupField=1, groupName='class'),
                 geometry=aoi,
                 scale=30,
-                maxPixels=1e9
-            )
+                maxPixels=1e9,
+                tileScale=4
+            ).getInfo()
             
-            # Calculate severity statistics
-            if 'burn_severity' in indices:
-                severity = indices['burn_severity']
-                
-                # Area by severity class
-                severity_stats = {}
-                for i in range(6):
-                    mask = severity.eq(i)
-                    area = area_image.updateMask(mask).reduceRegion(
-                        reducer=ee.Reducer.sum(),
-                        geometry=aoi,
-                        scale=30,
-                        maxPixels=1e9
-                    )
-                    severity_stats[f'severity_{i}'] = area
-                
-                return {
-                    'burned_area': burned_stats,
-                    'severity_stats': severity_stats
-                }
+            severity_stats = {f'severity_{i}': 0 for i in range(6)}
+            for group in grouped.get('groups', []):
+                severity_stats[f"severity_{int(group['class'])}"] = group['sum']
+            
+            # Burned area (dNBR >= 0.1) is exactly severity classes 2-5
+            burned_area = sum(severity_stats[f'severity_{i}'] for i in range(2, 6))
+            
+            return {
+                'burned_area': burned_area,
+                'severity_stats': severity_stats
+            }
         
         return None
         
@@ -317,25 +311,41 @@ def calculate_fire_statistics(indices, aoi):
         st.warning(f"Could not calculate fire statistics: {e}")
         return None
 
+@st.cache_data
+def _load_image_bytes(path):
+    """Read an image file once, returning None if it is missing or unreadable."""
+    try:
+        return Path(path).read_bytes()
+    except OSError:
+        return None
+
+# Static sidebar text, sent as one markdown block each instead of one message per line
+_FIRE_INFO_MD = (
+    "**Location**: Pacific Palisades, Los Angeles\n\n"
+    "**Start Date**: January 7, 2025\n\n"
+    "**Coordinates**: 34.0725°N, 118.5425°W\n\n"
+    "**Size**: ~23,713 acres (~96 km²)"
+)
+
+_SATELLITE_INFO_MD = (
+    "**Primary Satellite**: Sentinel-2\n\n"
+    "📡 High-resolution (10m) optical imagery"
+)
+
 def create_sidebar():
     """Create sidebar with controls."""
     
-    # Add logo to sidebar
-    logo_path = "/Users/jlipsitt/Documents/forwardfuture/assets/logos/logo_transparent.png"
-    try:
-        st.sidebar.image(logo_path, width=100)
-    except Exception as e:
-        pass  # Continue without logo if it doesn't load
+    # Add logo to sidebar (continue without logo if it doesn't load)
+    logo = _load_image_bytes(str(LOGO_PATH))
+    if logo:
+        st.sidebar.image(logo, width=100)
     
     st.sidebar.title("Palisades Fire Analysis Dashboard")
     st.sidebar.markdown("---")
     
     # Fire information
     st.sidebar.subheader("🔥 Fire Information")
-    st.sidebar.write("**Location**: Pacific Palisades, Los Angeles")
-    st.sidebar.write("**Start Date**: January 7, 2025")
-    st.sidebar.write("**Coordinates**: 34.0725°N, 118.5425°W")
-    st.sidebar.write("**Size**: ~23,713 acres (~96 km²)")
+    st.sidebar.markdown(_FIRE_INFO_MD)
     
     st.sidebar.markdown("---")
     
@@ -359,8 +369,7 @@ def create_sidebar():
     # Satellite selection
     st.sidebar.subheader("🛰️ Satellite Data")
     satellite = "Sentinel-2"  # Use Sentinel-2 only
-    st.sidebar.write("**Primary Satellite**: Sentinel-2")
-    st.sidebar.write("📡 High-resolution (10m) optical imagery")
+    st.sidebar.markdown(_SATELLITE_INFO_MD)
     
     # Analysis options
     st.sidebar.subheader("🔍 Analysis Options")
@@ -380,15 +389,15 @@ def create_sidebar():
 def main():
     """Main dashboard application."""
     
-    # Configure page
-    logo_path = "/Users/jlipsitt/Documents/forwardfuture/assets/logos/logo_transparent.png"
+    # Per-session cache of EE imagery/indices keyed on (before_date, after_date)
+    analysis_cache = st.session_state.setdefault('indices_cache', {})
     
     # Add banner image at the top
-    banner_path = "/Users/jlipsitt/Documents/forwardfuture/assets/images/banner_cropped_more.png"
-    try:
-        st.image(banner_path, use_container_width=True)
+    banner = _load_image_bytes(str(BANNER_PATH))
+    if banner:
+        st.image(banner, use_container_width=True)
         st.markdown("<br>", unsafe_allow_html=True)  # Add small space after banner
-    except Exception as e:
+    else:
         # Fallback if image doesn't load
         st.title("🔥 Palisades Fire Before/After Analysis")
     
@@ -412,19 +421,30 @@ def main():
     # Main content
     if gee_available:
         with st.spinner("Loading satellite imagery and calculating fire indices..."):
-            # Load imagery
-            imagery = load_fire_datasets(config['before_date'], config['after_date'], aoi)
-            
-            # Calculate fire indices using Sentinel-2 data
-            before_img = imagery['sentinel_before'] 
-            after_img = imagery['sentinel_after']
-            
-            indices = {}
-            if before_img and after_img:
-                indices = calculate_fire_indices(before_img, after_img)
+            # Only rebuild EE graphs when the analysis dates change
+            date_key = (config['before_date'], config['after_date'])
+            if date_key not in analysis_cache:
+                # Load imagery
+                imagery = load_fire_datasets(config['before_date'], config['after_date'], aoi)
                 
-                if config['show_severity'] and 'dnbr' in indices:
-                    indices['burn_severity'] = classify_burn_severity(indices['dnbr'])
+                # Calculate fire indices using Sentinel-2 data
+                before_img = imagery['sentinel_before'] 
+                after_img = imagery['sentinel_after']
+                
+                indices = {}
+                if before_img and after_img:
+                    # Copy so the cached indices shared across reruns aren't mutated
+                    indices = dict(calculate_fire_indices(before_img, after_img))
+                    
+                    if 'dnbr' in indices:
+                        indices['burn_severity'] = classify_burn_severity(indices['dnbr'])
+                
+                analysis_cache[date_key] = {'imagery': imagery, 'indices': indices}
+            
+            imagery = analysis_cache[date_key]['imagery']
+            indices = dict(analysis_cache[date_key]['indices'])
+            if not config['show_severity']:
+                indices.pop('burn_severity', None)
         
         # Show fire impact completion status
         st.success("🔥 **Fire Impact Analysis COMPLETE** - All satellite data loaded and indices calculated")
@@ -484,7 +504,7 @@ def main():
         
         # Add fire area boundary
         folium.Rectangle(
-            bounds=[[PALISADES_FIRE_BBOX[1], PALISADES_FIRE_BBOX[0]], [PALISADES_FIRE_BBOX[3], PALISADES_FIRE_BBOX[2]]],
+            bounds=PALISADES_FIRE_FOLIUM_BOUNDS,
             color='red',
             fill=True,
             fillColor='red',
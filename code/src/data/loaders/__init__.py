@@ -0,0 +1,19 @@
+"""
+Data loaders for Google Earth Engine Dashboard
+
+Functions that build Earth Engine datasets used by the dashboards and scripts.
+"""
+
+from .gee_loaders import (
+    get_band_names,
+    zero_image,
+    create_fire_aoi,
+    build_sentinel_composites
+)
+
+__all__ = [
+    'get_band_names',
+    'zero_image',
+    'create_fire_aoi',
+    'build_sentinel_composites'
+]
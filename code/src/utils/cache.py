@@ -0,0 +1,11 @@
+"""
+Persistent disk cache for Earth Engine metadata
+
+Survives process and container restarts, unlike Streamlit's in-memory caches.
+"""
+
+from diskcache import Cache
+
+from utils.constants import EE_CACHE_DIR
+
+disk_cache = Cache(str(EE_CACHE_DIR))
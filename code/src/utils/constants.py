@@ -3,6 +3,7 @@ Project constants and configuration values
 """
 
 import os
+import types
 from pathlib import Path
 
 # Project paths
@@ -12,6 +13,10 @@ OUTPUTS_DIR = PROJECT_ROOT / "outputs"
 CONFIG_DIR = PROJECT_ROOT / "config"
 ASSETS_DIR = PROJECT_ROOT / "assets"
 
+# Dashboard images
+LOGO_PATH = Path(os.getenv('DASHBOARD_LOGO_PATH', str(ASSETS_DIR / "logos" / "logo_transparent.png")))
+BANNER_PATH = Path(os.getenv('DASHBOARD_BANNER_PATH', str(ASSETS_DIR / "images" / "banner_cropped_more.png")))
+
 # Data directories
 RAW_DATA_DIR = INPUTS_DIR / "raw"
 PROCESSED_DATA_DIR = INPUTS_DIR / "processed"
@@ -42,12 +47,30 @@ DEFAULT_MAP_CENTER = [
 DEFAULT_MAP_ZOOM = int(os.getenv('DEFAULT_MAP_ZOOM', '12'))  # Zoomed in for fire analysis
 
 # Palisades Fire specific constants
-PALISADES_FIRE_CENTER = [34.0725, -118.5425]
-PALISADES_FIRE_BBOX = [-118.65, 34.0, -118.45, 34.15]  # [west, south, east, north]
+PALISADES_FIRE_CENTER = (34.0725, -118.5425)
+PALISADES_FIRE_BBOX = (-118.65, 34.0, -118.45, 34.15)  # (west, south, east, north)
+PALISADES_FIRE_FOLIUM_BOUNDS = [
+    [PALISADES_FIRE_BBOX[1], PALISADES_FIRE_BBOX[0]],  # [south, west]
+    [PALISADES_FIRE_BBOX[3], PALISADES_FIRE_BBOX[2]]   # [north, east]
+]
 PALISADES_FIRE_START_DATE = "2025-01-07"
 PALISADES_FIRE_SIZE_ACRES = 23713
 PALISADES_FIRE_SIZE_HECTARES = 9593  # Approximately
 
+# dNBR lower bounds for burn severity classes 1-5 (class 0 is below all of them)
+BURN_SEVERITY_THRESHOLDS = [-0.1, 0.1, 0.27, 0.44, 0.66]
+
+# Pre-baked Sentinel-2 composites keyed on (before_date, after_date)
+# Export them with code/scripts/bake_composites.py, then enable the lookup
+USE_PRECOMPUTED_COMPOSITES = os.getenv('USE_PRECOMPUTED_COMPOSITES', 'false').lower() == 'true'
+PRECOMPUTED_ASSET_ROOT = os.getenv('PRECOMPUTED_ASSET_ROOT', 'projects/ee-jonahlipsitt/assets/palisades')
+PRECOMPUTED_COMPOSITES = {
+    ('2024-11-01', '2025-02-01'): {
+        'before': f'{PRECOMPUTED_ASSET_ROOT}/s2_before_20241101',
+        'after': f'{PRECOMPUTED_ASSET_ROOT}/s2_after_20250201'
+    }
+}
+
 # Visualization palettes
 PALETTES = {
     'elevation': ['006633', 'E5FFCC', '662A00', 'D8D8D8', 'F5F5F5'],
@@ -93,6 +116,13 @@ FIRE_VIS_PARAMS = {
     }
 }
 
+# Freeze each visualization (with sorted keys) so it can't be mutated by callers
+# and always produces the same tile-cache key
+FIRE_VIS_PARAMS = {
+    name: types.MappingProxyType(dict(sorted(vis.items())))
+    for name, vis in FIRE_VIS_PARAMS.items()
+}
+
 # File formats
 SUPPORTED_VECTOR_FORMATS = ['.shp', '.geojson', '.kml', '.gpx']
 SUPPORTED_RASTER_FORMATS = ['.tif', '.tiff', '.nc', '.hdf', '.he5']
@@ -102,6 +132,9 @@ SUPPORTED_TABLE_FORMATS = ['.csv', '.xlsx', '.json', '.parquet']
 MEMORY_LIMIT = os.getenv('MEMORY_LIMIT', '2GB')
 MAX_WORKERS = int(os.getenv('MAX_WORKERS', '4'))
 CACHE_TIMEOUT = int(os.getenv('CACHE_TIMEOUT', '3600'))
+EE_CACHE_DIR = Path(os.getenv('EE_CACHE_DIR', str(PROJECT_ROOT / '.ee_cache')))
+EE_METADATA_CACHE_TTL = int(os.getenv('EE_METADATA_CACHE_TTL', '86400'))  # 24 hours
+EE_CONNECTION_CACHE_TTL = int(os.getenv('EE_CONNECTION_CACHE_TTL', '60'))  # seconds
 
 # Logging
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
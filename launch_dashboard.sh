@@ -35,6 +35,10 @@ export GEE_PROJECT_ID="ee-jonahlipsitt"
 
 echo "✅ Environment: $CONDA_DEFAULT_ENV"
 echo "✅ Project ID: $GEE_PROJECT_ID"
+
+# Byte-compile the source tree before launch so the first page render doesn't pay for it
+python -m compileall -q code/src
+
 echo "🚀 Launching dashboard..."
 echo ""
 echo "Dashboard will be available at: http://localhost:8501"
@@ -3,73 +3,174 @@
 Quick start script for the Google Earth Engine Dashboard
 
 This script sets up the environment and launches the Streamlit dashboard.
+Streamlit runs in-process by default; pass --subprocess to launch it in a
+fresh interpreter (replacing this process) instead, and --check-auth to verify
+Google Earth Engine authentication before launching.
 """
 
 import os
+import re
 import sys
-import subprocess
-from pathlib import Path
+import json
+import hashlib
+import functools
+import threading
+import importlib.util
 
-# Add the code/src directory to Python path
-project_root = Path(__file__).parent
-src_path = project_root / "code" / "src"
-sys.path.insert(0, str(src_path))
+# Project paths, computed once as plain strings
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+SRC_PATH = os.path.join(PROJECT_ROOT, "code", "src")
+ENV_FILE = os.path.join(PROJECT_ROOT, ".env")
+ENVIRONMENT_FILE = os.path.join(PROJECT_ROOT, "environment.yml")
+DASHBOARD_PATH = os.path.join(SRC_PATH, "dashboards", "streamlit", "palisades_fire_app.py")
+EE_CREDENTIALS_FILE = os.path.expanduser(os.path.join("~", ".config", "earthengine", "credentials"))
 
+# Required packages as (distribution name, import name)
+REQUIRED_PACKAGES = (
+    ('streamlit', 'streamlit'),
+    ('geemap', 'geemap'), 
+    ('earthengine-api', 'ee'),
+    ('folium', 'folium'),
+    ('plotly', 'plotly'),
+    ('pandas', 'pandas'),
+    ('diskcache', 'diskcache')
+)
+
+INSTALL_HINT = (
+    "\n💡 Install missing packages with:\n"
+    "   conda env create -f environment.yml\n"
+    "   conda activate gee-dashboard"
+)
+
+AUTH_HELP = (
+    "\n🔧 To authenticate Google Earth Engine:\n"
+    "1. Visit: https://developers.google.com/earth-engine/guides/access\n"
+    "2. Sign up for Earth Engine access\n"
+    "3. Run: earthengine authenticate\n"
+    "4. Set GEE_PROJECT_ID in .env file\n"
+    "\n⚠️  Running dashboard in DEMO mode (no live satellite data)\n"
+    "✅ You can still explore the interface and functionality"
+)
+
+# Google Cloud project ID format: 6-30 chars, lowercase letters, digits and hyphens
+PROJECT_ID_PATTERN = re.compile(r"^[a-z][-a-z0-9]{4,28}[a-z0-9]$")
+
+# Startup checks that passed, keyed by check name -> environment fingerprint
+STARTUP_CACHE_FILE = os.path.expanduser(os.path.join("~", ".cache", "palisades-fire", "startup.json"))
+
+def _env_fingerprint():
+    """Hash the parts of the environment that decide whether startup checks pass."""
+    service_account_key = os.getenv('GEE_SERVICE_ACCOUNT_KEY', '')
+    parts = [
+        sys.executable, sys.version, os.getenv('GEE_PROJECT_ID', ''),
+        os.getenv('GEE_SERVICE_ACCOUNT', ''), service_account_key
+    ]
+    for path in (ENVIRONMENT_FILE, EE_CREDENTIALS_FILE, service_account_key):
+        try:
+            parts.append(str(os.path.getmtime(path)))
+        except OSError:
+            parts.append("missing")
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+def disk_memoize(check):
+    """Skip a startup check that already passed in the same environment."""
+    @functools.wraps(check)
+    def wrapper():
+        fingerprint = _env_fingerprint()
+        try:
+            with open(STARTUP_CACHE_FILE) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        
+        if cache.get(check.__name__) == fingerprint:
+            return True
+        
+        result = check()
+        if result:
+            # Only successes are cached so failures are re-checked next launch
+            cache[check.__name__] = fingerprint
+            try:
+                os.makedirs(os.path.dirname(STARTUP_CACHE_FILE), exist_ok=True)
+                with open(STARTUP_CACHE_FILE, "w") as f:
+                    json.dump(cache, f)
+            except OSError:
+                pass
+        return result
+    return wrapper
+
+@disk_memoize
 def check_requirements():
     """Check if required packages are installed."""
-    # Check required packages with correct import names
-    required_checks = [
-        ('streamlit', 'streamlit'),
-        ('geemap', 'geemap'), 
-        ('earthengine-api', 'ee'),
-        ('folium', 'folium'),
-        ('plotly', 'plotly'),
-        ('pandas', 'pandas')
-    ]
-    
+    # Only locate the modules - importing them would run all their top-level code
     missing_packages = []
-    for package_name, import_name in required_checks:
-        try:
-            __import__(import_name)
-        except ImportError:
+    for package_name, import_name in REQUIRED_PACKAGES:
+        if importlib.util.find_spec(import_name) is None:
             missing_packages.append(package_name)
     
     if missing_packages:
         print("❌ Missing required packages:")
-        for package in missing_packages:
-            print(f"   - {package}")
-        print("\n💡 Install missing packages with:")
-        print("   conda env create -f environment.yml")
-        print("   conda activate gee-dashboard")
+        print("\n".join(f"   - {package}" for package in missing_packages))
+        print(INSTALL_HINT)
         return False
     
     return True
 
+def initialize_gee():
+    """Initialize Google Earth Engine, preferring the GEE_PROJECT_ID project."""
+    import ee
+    
+    # Try different initialization methods
+    project_id = os.getenv('GEE_PROJECT_ID')
+    if project_id and project_id != 'your-project-id' and PROJECT_ID_PATTERN.match(project_id):
+        try:
+            ee.Initialize(project=project_id)
+            print(f"✅ Google Earth Engine authentication successful with project: {project_id}")
+        except ee.EEException as e:
+            # Only a project problem is worth a default retry; auth errors propagate
+            if 'project' not in str(e).lower():
+                raise
+            print(f"⚠️  Project {project_id} failed, trying default initialization...")
+            ee.Initialize()
+            print("✅ Google Earth Engine authentication successful (default)")
+    else:
+        if project_id and project_id != 'your-project-id':
+            print(f"⚠️  GEE_PROJECT_ID '{project_id}' is not a valid project ID, using default initialization...")
+        # Try default initialization
+        ee.Initialize()
+        print("✅ Google Earth Engine authentication successful (default)")
+
+@disk_memoize
 def check_gee_auth():
     """Check if Google Earth Engine is authenticated."""
     try:
         import ee
         
-        # Try to initialize EE without project first
-        ee.Authenticate()
-        
-        # Try different initialization methods
-        project_id = os.getenv('GEE_PROJECT_ID')
-        if project_id and project_id != 'your-project-id':
-            try:
-                ee.Initialize(project=project_id)
-                print(f"✅ Google Earth Engine authentication successful with project: {project_id}")
-            except Exception as e:
-                print(f"⚠️  Project {project_id} failed, trying default initialization...")
-                ee.Initialize()
-                print("✅ Google Earth Engine authentication successful (default)")
+        # Production/Cloud: non-interactive service account authentication, through
+        # the same helper the dashboard uses (a no-op there once this succeeds)
+        sa_email = os.getenv('GEE_SERVICE_ACCOUNT')
+        if sa_email and os.getenv('GEE_SERVICE_ACCOUNT_KEY'):
+            from auth.gee_auth import initialize_ee
+            
+            if not initialize_ee(project_id=os.getenv('GEE_PROJECT_ID')):
+                raise RuntimeError(f"service account {sa_email} could not initialize Earth Engine")
+            print(f"✅ Google Earth Engine authenticated with service account: {sa_email}")
         else:
-            # Try default initialization
-            ee.Initialize()
-            print("✅ Google Earth Engine authentication successful (default)")
+            # Local development: user credentials
+            # Authenticate up front only if there are no cached credentials
+            if not os.path.exists(EE_CREDENTIALS_FILE):
+                ee.Authenticate()
+            
+            try:
+                initialize_gee()
+            except ee.EEException:
+                # Cached credentials are invalid or expired - authenticate and retry
+                ee.Authenticate()
+                initialize_gee()
         
-        # Test connection with a simple operation
-        ee.Image(1).getInfo()
+        # Optionally test connection with a simple operation (a full server round-trip)
+        if os.getenv('GEE_VERIFY_CONNECTION', 'false').lower() == 'true':
+            ee.Image(1).getInfo()
         return True
         
     except Exception as e:
@@ -79,15 +180,27 @@ def check_gee_auth():
         print("   earthengine authenticate")
         return False
 
+def warm_dashboard_imports():
+    """Import the dashboard's heavy dependencies so they are cached in sys.modules."""
+    # geemap >= 0.37 breaks `import geemap.foliumap` unless USE_FOLIUM is set before import
+    os.environ.setdefault("USE_FOLIUM", "1")
+    try:
+        import ee  # noqa: F401
+        import folium  # noqa: F401
+        import pandas  # noqa: F401
+        import geemap.foliumap  # noqa: F401
+    except Exception:
+        pass  # The dashboard reports import problems itself
+
 def setup_environment():
     """Setup environment variables from .env file if it exists."""
-    env_file = project_root / ".env"
-    if env_file.exists():
-        try:
+    if os.path.exists(ENV_FILE):
+        # Locate dotenv without a failing import walking every finder
+        if importlib.util.find_spec('dotenv') is not None:
             from dotenv import load_dotenv
-            load_dotenv(env_file)
+            load_dotenv(ENV_FILE)
             print("✅ Loaded environment variables from .env")
-        except ImportError:
+        else:
             print("⚠️  python-dotenv not installed, skipping .env file")
     else:
         print("ℹ️  No .env file found (this is optional)")
@@ -95,8 +208,16 @@ def setup_environment():
 def main():
     """Main function to run the dashboard."""
     
-    print("🌍 Starting Google Earth Engine Dashboard...")
-    print("=" * 50)
+    # Add the code/src directory to Python path (only when actually launching,
+    # so importing this module has no side effects)
+    if SRC_PATH not in sys.path:
+        sys.path.insert(0, SRC_PATH)
+    
+    # Banners are only useful on an interactive terminal; errors always print
+    show_banner = sys.stdout.isatty()
+    
+    if show_banner:
+        print("🌍 Starting Google Earth Engine Dashboard...\n" + "=" * 50)
     
     # Setup environment
     setup_environment()
@@ -105,35 +226,50 @@ def main():
     if not check_requirements():
         sys.exit(1)
     
-    # Check GEE authentication
-    if not check_gee_auth():
-        print("\n🔧 To authenticate Google Earth Engine:")
-        print("1. Visit: https://developers.google.com/earth-engine/guides/access")
-        print("2. Sign up for Earth Engine access")
-        print("3. Run: earthengine authenticate")
-        print("4. Set GEE_PROJECT_ID in .env file")
-        print("\n⚠️  Running dashboard in DEMO mode (no live satellite data)")
-        print("✅ You can still explore the interface and functionality")
+    # Streamlit runs in this interpreter unless --subprocess is given, so warm the
+    # dashboard's imports in the background while the remaining checks run
+    if "--subprocess" not in sys.argv[1:]:
+        threading.Thread(target=warm_dashboard_imports, daemon=True).start()
     
-    # Launch Streamlit dashboard - Palisades Fire Analysis
-    dashboard_path = src_path / "dashboards" / "streamlit" / "palisades_fire_app.py"
+    # Earth Engine is initialized (once per server) by the dashboard itself;
+    # only check authentication up front when explicitly requested
+    if "--check-auth" in sys.argv[1:] and not check_gee_auth():
+        print(AUTH_HELP)
     
-    print(f"\n🔥 Launching Palisades Fire Analysis Dashboard...")
-    print(f"📁 Dashboard file: {dashboard_path}")
-    print(f"🌐 URL: http://localhost:8501")
-    print(f"📍 Analyzing the January 2025 Palisades Fire in Los Angeles")
-    print("\n" + "=" * 50)
+    # Launch Streamlit dashboard - Palisades Fire Analysis
+    if show_banner:
+        print(
+            "\n🔥 Launching Palisades Fire Analysis Dashboard...\n"
+            f"📁 Dashboard file: {DASHBOARD_PATH}\n"
+            "🌐 URL: http://localhost:8501\n"
+            "📍 Analyzing the January 2025 Palisades Fire in Los Angeles\n"
+            "\n" + "=" * 50
+        )
     
-    # Set up Streamlit command
-    cmd = [
-        sys.executable, "-m", "streamlit", "run", 
-        str(dashboard_path),
-        "--server.port", "8501",
-        "--server.address", "localhost"
-    ]
+    # Run from the project root so .streamlit/config.toml is picked up
+    os.chdir(PROJECT_ROOT)
     
     try:
-        subprocess.run(cmd, cwd=project_root)
+        if "--subprocess" in sys.argv[1:]:
+            # Run Streamlit in a fresh interpreter for isolation. exec replaces this
+            # process (freeing everything the launcher loaded) and never returns.
+            cmd = [
+                sys.executable, "-m", "streamlit", "run", 
+                DASHBOARD_PATH,
+                "--server.port", "8501",
+                "--server.address", "localhost"
+            ]
+            # exec discards Python's unflushed buffers, so flush piped output first
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(sys.executable, cmd)
+        else:
+            # Run Streamlit in this interpreter, avoiding a second cold start
+            from streamlit.web import bootstrap
+            
+            flag_options = {"server_port": 8501, "server_address": "localhost"}
+            bootstrap.load_config_options(flag_options)
+            bootstrap.run(DASHBOARD_PATH, False, [], flag_options)
     except KeyboardInterrupt:
         print("\n👋 Dashboard stopped by user")
     except Exception as e:
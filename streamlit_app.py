@@ -9,13 +9,20 @@ It imports and runs the main dashboard application.
 import sys
 from pathlib import Path
 
-# Add the code/src directory to Python path for imports
-project_root = Path(__file__).parent
-code_src_path = project_root / "code" / "src"
-sys.path.insert(0, str(code_src_path))
 
-# Import and run the main dashboard
-from dashboards.streamlit.palisades_fire_app import main
+def main():
+    """Import and run the main dashboard."""
+    # Add the code/src directory to Python path for imports (once - Streamlit
+    # re-executes this script on every rerun). Done here rather than at import
+    # so merely importing this module has no side effects.
+    code_src_path = str(Path(__file__).parent / "code" / "src")
+    if code_src_path not in sys.path:
+        sys.path.insert(0, code_src_path)
+    
+    # Imported here so loading this module stays cheap; the dashboard pulls in
+    # Earth Engine and its mapping dependencies
+    from dashboards.streamlit.palisades_fire_app import main as run_dashboard
+    return run_dashboard()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file